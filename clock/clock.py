@@ -1,6 +1,12 @@
 """This code wraps a PCA9685 ServoController for use as a clock face."""
+import ustruct  # type: ignore
+from micropython import const  # type: ignore
 from clock import pca9685
 
+_TENS_PIN = const(7)  # First pin of the 'tens' place.
+_FACE_PINS = const(14)
+_PLACE_BYTES = const(28)  # 7 pins * 4 PWM registers.
+
 
 class Segment:
     """This class controls a set of servos as a clock face.
@@ -19,10 +25,20 @@ class Segment:
         """
         self.board = board
         self._duties = duties
-        # Pins 0 - 6 are the 'ones' place.
-        self.ones = [(index, pin) for index, pin in enumerate(range(7))]
-        # Pins 7-13 are the 'tens' place.
-        self.tens = [(index, pin) for index, pin in enumerate(range(7, 14))]
+        # Pins 0 - 6 are the 'ones' place, pins 7-13 the 'tens' place.
+        ones_pins = board.pins[0:_TENS_PIN]
+        tens_pins = board.pins[_TENS_PIN:_FACE_PINS]
+        # Packed PWM registers for each numeral, indexed by digit.
+        self._ones_table = [self._pack_digit(d, ones_pins) for d in range(10)]
+        self._tens_table = [self._pack_digit(d, tens_pins) for d in range(10)]
+        # Reusable buffer for writing both places at once.
+        self._txbuf = bytearray(2 * _PLACE_BYTES)
+        # Last digits written to the board, so unchanged places are not
+        # rewritten.
+        self._last_ones = self._last_tens = -1
+        # Staged digits, first pin and packed registers awaiting flush().
+        self._ones = self._tens = -1
+        self._pending_pin, self._pending = 0, None
 
     def duties(self, pin: int) -> tuple:
         """Get off, on duties for the servo.
@@ -37,24 +53,50 @@ class Segment:
 
     def write(self, number: int) -> None:
         """Write a number to the clock face."""
+        self.stage(number)
+        self.flush()
+
+    def stage(self, number: int) -> None:
+        """Prepare a number for the clock face without writing it.
+
+        Places already showing their digit are skipped. Staging again
+        before flush() replaces the earlier number.
+        """
         tens, ones = divmod(number, 10)
-        for index, pin in self.ones:
-            off, on = self.duties(pin)
-            pin = self.board.pins[pin]
-            if bits_representation[ones] & pow(2, index):
-                pin.duty = on
-            else:
-                pin.duty = off
-        for index, pin in self.tens:
-            off, on = self.duties(pin)
-            pin = self.board.pins[pin]
-            if bits_representation[tens] & pow(2, index):
-                pin.duty = on
+        self._ones, self._tens = ones, tens
+        if ones != self._last_ones and tens != self._last_tens:
+            # Pins 0-13 are consecutive, so the whole face is one transaction.
+            self._txbuf[0:_PLACE_BYTES] = self._ones_table[ones]
+            self._txbuf[_PLACE_BYTES:] = self._tens_table[tens]
+            self._pending_pin, self._pending = 0, self._txbuf
+        elif ones != self._last_ones:
+            self._pending_pin, self._pending = 0, self._ones_table[ones]
+        elif tens != self._last_tens:
+            self._pending_pin = _TENS_PIN
+            self._pending = self._tens_table[tens]
+        else:
+            self._pending = None
+
+    def flush(self) -> None:
+        """Write the staged number to the board, if any."""
+        if self._pending is not None:
+            self.board.write_pwm_data(self._pending_pin, self._pending)
+            self._last_ones, self._last_tens = self._ones, self._tens
+            self._pending = None
+
+    def _pack_digit(self, digit: int, pins: list) -> bytes:
+        """Pack PWM on/off counts showing digit on a set of pins."""
+        data = b""
+        for segment, pin in enumerate(pins):
+            off, on = self.duties(pin.index)
+            if _BITS[digit] & (1 << segment):
+                data += ustruct.pack("<2H", *pin.pwm_counts(on))
             else:
-                pin.duty = off
+                data += ustruct.pack("<2H", *pin.pwm_counts(off))
+        return data
 
 
-bits_representation = (
+_BITS = bytes((
     # Bitwise representation for numeral at index.
     0x3F,  # 0 - on: segments 0, 1, 2, 3, 4, 5
     0x06,  # 1 - on: segments 1, 2
@@ -66,4 +108,4 @@ bits_representation = (
     0x07,  # 7 - on: segments 0, 1, 2
     0x7F,  # 8 - on: segments 0, 1, 2, 3, 4, 5, 6
     0x6F   # 9 - on: segments 0, 1, 2, 3, 5, 6
-)
+))
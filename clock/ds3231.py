@@ -16,13 +16,13 @@ class DS3231:
     @property
     def hour(self) -> int:
         """Get/store hour on the DS3231 board."""
-        return _decodeByte(self.i2c.readfrom_mem(self.address, 0x02, 1))
+        return _decodeHour(self.i2c.readfrom_mem(self.address, 0x02, 1)[0])
 
     @hour.setter
     def hour(self, hour) -> None:
         if not 0 <= hour <= 23:
             raise ValueError("Hour must be between 0 and 23.")
-        self._i2c.writeto_mem(self.address, 0x02, _encodeByte(hour))
+        self.i2c.writeto_mem(self.address, 0x02, _encodeByte(hour))
 
     @property
     def minute(self) -> int:
@@ -33,22 +33,62 @@ class DS3231:
     def minute(self, minute) -> None:
         if not 0 <= minute <= 59:
             raise ValueError("Minute must be between 0 and 59.")
-        self._i2c.writeto_mem(self.address, 0x01, _encodeByte(minute))
+        self.i2c.writeto_mem(self.address, 0x01, _encodeByte(minute))
 
     @property
     def second(self) -> int:
         """Get second on the DS3231 board."""
         return _decodeByte(self.i2c.readfrom_mem(self.address, 0x00, 1))
 
+    def write_time(self, hour: int, minute: int, second: int) -> None:
+        """Store hour, minute, and second on the DS3231 in one write."""
+        if not 0 <= hour <= 23:
+            raise ValueError("Hour must be between 0 and 23.")
+        if not 0 <= minute <= 59:
+            raise ValueError("Minute must be between 0 and 59.")
+        if not 0 <= second <= 59:
+            raise ValueError("Second must be between 0 and 59.")
+        self.i2c.writeto_mem(self.address, 0x00, _encodeByte(second)
+                             + _encodeByte(minute) + _encodeByte(hour))
+
+    def enable_square_wave(self) -> None:
+        """Output a 1Hz square wave on the INT/SQW pin.
+
+        Clears the control register (0x0E): oscillator on, INTCN off,
+        and rate select bits RS2/RS1 at 1Hz.
+        """
+        self.i2c.writeto_mem(self.address, 0x0E, bytes([0x00]))
+
+    def read_time(self) -> tuple:
+        """Get (hour, minute, second) from the DS3231 in one read."""
+        raw = self.i2c.readfrom_mem(self.address, 0x00, 3)
+        return _decodeHour(raw[2]), _BCD[raw[1]], _BCD[raw[0]]
+
 
 def _decodeByte(byte) -> int:
     """Decode a byte value from the clock to decimal."""
-    tens = (byte[0] >> 4) * 10
-    ones = byte[0] & 0x0F
-    return tens + ones
+    return _BCD[byte[0]]
+
+
+def _decodeHour(byte: int) -> int:
+    """Decode the hour register to a 24 hour value.
+
+    In 12 hour mode (bit 6 set) bit 5 is the PM flag; otherwise bit 5 is
+    part of the tens digit. Datasheet Figure 1, p.11.
+    """
+    if byte & 0x40:
+        hour = _BCD[byte & 0x1F] % 12
+        if byte & 0x20:
+            hour += 12
+        return hour
+    return _BCD[byte & 0x3F]
 
 
 def _encodeByte(num) -> bytes:
     """Encode a decimal value for writing to the clock."""
     tens, ones = divmod(num, 10)
     return bytes([(tens << 4) + ones])
+
+
+# Decimal value for each binary-coded decimal byte the clock stores.
+_BCD = bytes(((x >> 4) * 10) + (x & 0x0F) for x in range(256))
@@ -6,18 +6,27 @@ Datasheet: https://cdn-shop.adafruit.com/datasheets/PCA9685.pdf
 
 import ustruct  # type: ignore
 import machine  # type: ignore
+from micropython import const  # type: ignore
 from time import sleep_us
 
+_MODE1 = const(0x00)
+_PRESCALE = const(0xFE)
+_LED0_ON_L = const(0x06)  # First PWM register, 4 per pin. Datasheet §7.3.3.
+_FULL_ON = const(4096)  # Full on/off bit in LEDn_ON_H/LEDn_OFF_H.
+_MAX_COUNT = const(4095)
+_OSC_CLOCK = const(25_000_000)
+
 
 class PCA9685:
     """This class provides basic board memory controls."""
 
-    def __init__(self, i2c: machine.SoftI2C,
+    def __init__(self, i2c: machine.I2C,
                  address: int = 0x40) -> None:
         """Defaults board I2C address to 0x40 (see datasheet)."""
         self.i2c = i2c
         self.address = address
         self.pins = [PWMPin(self, i) for i in range(16)]
+        self._scale = None
         self._reset()
 
     @property
@@ -26,21 +35,30 @@ class PCA9685:
 
         For more information on the prescaler formula used,
         see the PCA9685 datasheet §7.3.5, p.25.
+
+        The last prescaler written is cached, so reads skip the board and
+        setting a frequency with an unchanged prescaler does not restart
+        the oscillator.
         """
-        scale = self.read_memory(0xFE)[0]
-        return round(25_000_000 / (4096 * (scale + 1)))
+        scale = self._scale
+        if scale is None:
+            scale = self.read_memory(_PRESCALE)[0]
+        return round(_OSC_CLOCK / (4096 * (scale + 1)))
 
     @frequency.setter
     def frequency(self, frequency: int) -> None:
         if not 24 <= frequency <= 1526:
             raise ValueError(f"Invalid PWM frequency ({frequency}Hz). \
                                Prescaler allows 24Hz - 1526Hz")
-        scale = round(25_000_000 / (4096.0 * frequency))
-        self.write_memory(0x00, [0x10])  # Clear Mode1 and set sleep bit.
-        self.write_memory(0xFE, [scale])  # Write prescaler.
-        self.write_memory(0x00, [0x00])  # Clear Mode1.
+        scale = round(_OSC_CLOCK / (4096.0 * frequency))
+        if scale == self._scale:
+            return
+        self.write_memory(_MODE1, [0x10])  # Clear Mode1 and set sleep bit.
+        self.write_memory(_PRESCALE, [scale])  # Write prescaler.
+        self.write_memory(_MODE1, [0x00])  # Clear Mode1.
         sleep_us(500)
-        self.write_memory(0x00, [0xA1])  # Set restart & auto-increment bits.
+        self.write_memory(_MODE1, [0xA1])  # Set restart & auto-increment bits.
+        self._scale = scale
 
     def read_memory(self, memory_address: int,
                     length: int = 1, unpack: bool = True) -> tuple | bytes:
@@ -66,11 +84,12 @@ class PCA9685:
         """Write values to board memory.
 
         * address: Memory address to begin write.
-        * values: Raw bytes to write or tuple/list of unpacked bytes to write.
+        * values: Raw bytes/bytearray to write (written as-is) or tuple/list
+        of unpacked bytes to write (range checked).
         """
-        if type(values) is bytes:
+        if isinstance(values, (bytes, bytearray)):
             data = values
-        elif type(values) is tuple or type(values) is list:
+        elif isinstance(values, (tuple, list)):
             for value in values:
                 if not 0 <= value <= 255:
                     raise ValueError(f"Byte value out of range ({value}). \
@@ -81,14 +100,33 @@ class PCA9685:
                                list, or tuple, not {type(values)}.")
         self.i2c.writeto_mem(self.address, memory_address, data)
 
+    def write_pwm_data(self, start_pin: int, data: bytes) -> None:
+        """Write packed PWM registers for consecutive pins in one transaction.
+
+        Relies on the Mode1 auto-increment bit (set by _reset and the
+        frequency setter) so the board steps through each pin's registers.
+        Datasheet §7.3.1.
+
+        * start_pin: Index (0-15) of the first pin to write.
+        * data: Little-endian (on, off) counts, 4 bytes per pin.
+        """
+        count = len(data) // 4
+        if not (0 <= start_pin and start_pin + count <= 16):
+            raise ValueError(f"Invalid pin block ({start_pin}, {count}). \
+                               Pins must be between 0 and 15.")
+        self.i2c.writeto_mem(self.address, PWMPin._ADDR[start_pin], data)
+
     def _reset(self):
-        # Clear Mode1 register.
-        self.write_memory(0x00, [0x00])
+        # Clear Mode1 register, leaving only the auto-increment bit set.
+        self.write_memory(_MODE1, [0x20])
 
 
 class PWMPin:
     """This class provides basic duty/PWM operations for pins on the board."""
 
+    # First register address for each pin index. Datasheet §7.3.3.
+    _ADDR = tuple(_LED0_ON_L + (4 * i) for i in range(16))
+
     def __init__(self, parent: PCA9685, index: int):
         """Set up PWM pin.
 
@@ -96,50 +134,63 @@ class PWMPin:
         * index: Pin index 0-15.
         """
         self.index = index
-        # Calculate first register address for this pin. Datasheet §7.3.3.
-        self.address = 0x06 + (4 * self.index)
         self.parent = parent
+        # Reusable register buffer for set_pwm.
+        self._buf = bytearray(4)
 
     @property
     def pwm(self) -> tuple:
         """Get PWM on/off counts from memory."""
-        pwm = self.parent.read_memory(self.address, 4, unpack=False)
+        pwm = self.parent.read_memory(PWMPin._ADDR[self.index], 4,
+                                      unpack=False)
         return ustruct.unpack("<2H", pwm)
 
     def set_pwm(self, on: int, off: int) -> None:
         """Set PWM on/off counts in memory."""
-        if 0 <= on <= 4095 and 0 <= off <= 4096:
-            data = ustruct.pack("<2H", on, off)
-        else:
+        if not (0 <= on <= _MAX_COUNT and 0 <= off <= _FULL_ON):
             raise ValueError(f"PCA9685 at {self.parent.address} attempted \
                                to set invalid PWM ({on}, {off}) on pin \
                                {self.index}.")
-        self.parent.write_memory(self.address, data)
+        self._write_pwm(on, off)
 
     @property
     def duty(self) -> int:
         """Get/Store PWM duty cycle."""
         on, off = self.pwm
-        if on == 0 and off == 4096:
+        if on == 0 and off == _FULL_ON:
             value = 0
-        elif on == 4096 and off == 0:
-            value = 4095
+        elif on == _FULL_ON and off == 0:
+            value = _MAX_COUNT
         else:
             value = off
         return value
 
     @duty.setter
     def duty(self, value: int) -> None:
+        self.set_pwm(*self.pwm_counts(value))
+
+    def pwm_counts(self, value: int) -> tuple:
+        """Convert a duty cycle to bounded PWM on/off counts."""
         try:
             value = self._duty_bound(value)
         except NotImplementedError:
             pass
+        return self._counts(value)
+
+    def _counts(self, value: int) -> tuple:
+        """Convert a duty cycle to PWM on/off counts using full on/off."""
         if value == 0:
-            self.set_pwm(0, 4096)
-        elif value == 4095:
-            self.set_pwm(4096, 0)
+            return 0, _FULL_ON
+        elif value == _MAX_COUNT:
+            return _FULL_ON, 0
         else:
-            self.set_pwm(0, value)
+            return 0, value
+
+    def _write_pwm(self, on: int, off: int) -> None:
+        """Write PWM on/off counts to this pin's registers unchecked."""
+        ustruct.pack_into("<2H", self._buf, 0, on, off)
+        self.parent.i2c.writeto_mem(self.parent.address,
+                                    PWMPin._ADDR[self.index], self._buf)
 
     def _duty_bound(self, value: int) -> NotImplementedError:
         """Check that value is between set duty bounds.
@@ -153,7 +204,7 @@ class PWMPin:
 class ServoController(PCA9685):
     """This class sets up a PCA9685 board for use as a servo controller."""
 
-    def __init__(self, i2c: machine.SoftI2C, address: int = 0x40,
+    def __init__(self, i2c: machine.I2C, address: int = 0x40,
                  frequency: int = 50, min_duty: int = 180,
                  max_duty: int = 500) -> None:
         """Set up PCA9685 as a servo controller.
@@ -169,6 +220,7 @@ class ServoController(PCA9685):
         # 4095 steps * pulse length us / (1,000,000 us i2c limit * frequency)
         self.min_duty, self.max_duty = min_duty, max_duty
         self.pins = [ServoPin(self, i) for i in range(16)]
+        self._scale = None
         self._reset()
         self.frequency = frequency
 
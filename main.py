@@ -4,14 +4,41 @@ Creates a 'digital' clock display using hobby servos,
 two PCA9685 breakout boards, and a DS3231 precision
 clock board.
 """
-from machine import Pin, SoftI2C  # type: ignore
+import micropython  # type: ignore
+from machine import I2C, Pin, idle  # type: ignore
 from clock import clock, ds3231, pca9685
 
-if __name__ == "__main__":
-    scl = Pin(22, pull=Pin.PULL_UP, mode=Pin.OPEN_DRAIN)
-    sda = Pin(21, pull=Pin.PULL_UP, mode=Pin.OPEN_DRAIN)
+tick = False
+
+
+def _tick(pin) -> None:
+    """Flag a DS3231 square wave edge for the main loop."""
+    global tick
+    tick = True
 
-    i2c = SoftI2C(scl, sda)
+
+@micropython.native
+def run_clock(clock_board: ds3231.DS3231, minutes: clock.Segment,
+              hours: clock.Segment) -> None:
+    """Update the clock face on each square wave tick."""
+    global tick
+    while True:
+        idle()
+        if tick:
+            tick = False
+            # Read the time and prepare both faces, then issue both boards'
+            # writes back-to-back.
+            hour, minute, second = clock_board.read_time()
+            minutes.stage(minute)
+            hours.stage(hour)
+            minutes.flush()
+            hours.flush()
+            print(f'{hour:02}:{minute:02}:{second:02}')
+
+
+if __name__ == "__main__":
+    # Hardware I2C bus. 400kHz is the DS3231's maximum (PCA9685 allows 1MHz).
+    i2c = I2C(0, scl=Pin(22), sda=Pin(21), freq=400_000)
 
     minutes_duties = (
         (245, 450),
@@ -32,11 +59,8 @@ if __name__ == "__main__":
     hours = clock.Segment(pca9685.ServoController(i2c, address=0x41),
                           hours_duties)
     clock_board = ds3231.DS3231(i2c)
-    second = clock_board.second
-    while True:
-        if second != clock_board.second:
-            second = clock_board.second
-            print(f'{clock_board.hour:02}:{clock_board.minute:02}:\
-                    {clock_board.second:02}')
-            minutes.write(clock_board.minute)
-            hours.write(clock_board.hour)
+    # The DS3231's 1Hz INT/SQW output (open drain) wakes the loop each second.
+    clock_board.enable_square_wave()
+    sqw = Pin(4, Pin.IN, Pin.PULL_UP)
+    sqw.irq(trigger=Pin.IRQ_FALLING, handler=_tick)
+    run_clock(clock_board, minutes, hours)